@@ -12,11 +12,19 @@
 # Requires: usbipd-win v4+ on Windows, Python 3, Tkinter (included with standard Python)
 # Recommended: Run as Administrator for bind/attach/detach/unbind.
 
+import collections
+import concurrent.futures
+import functools
+import heapq
+import json
+import os
+import re
+import sys
 import threading
 import subprocess
-import queue
 import time
 import tkinter as tk
+from dataclasses import dataclass
 from tkinter import ttk, messagebox
 
 try:
@@ -30,7 +38,17 @@ except Exception:
 # ---- "acceptable devices" filter (in-memory only) ----
 ALLOW_VIDPID_PREFIXES = ["1050:"]  # Yubico vendor ID
 ALLOW_DEVICE_KEYWORDS = ["yubico", "yubikey", "security key", "fido"]
+
+# Lowercased once at import; is_security_key_device runs for every device on
+# every poll, and str.startswith takes a tuple.
+_ALLOW_VIDPID_PREFIXES_TUPLE = tuple(p.lower() for p in ALLOW_VIDPID_PREFIXES)
+_ALLOW_KEYWORDS_LOWER = tuple(k.lower() for k in ALLOW_DEVICE_KEYWORDS if k)
 TRAY_POLL_INTERVAL_SECONDS = 3
+TRAY_POLL_FAST_SECONDS = 0.5
+TRAY_POLL_MAX_SECONDS = 10
+TRAY_POLL_BACKOFF_AFTER = 3  # identical polls before the interval starts growing
+DEVICE_CACHE_MAX_AGE_SECONDS = 0.75
+REFRESH_DEBOUNCE_SECONDS = 0.15
 UI_FONT_FAMILY = "Bahnschrift"
 UI_COLORS = {
     "app_bg": "#eef2f7",
@@ -59,20 +77,24 @@ TREE_COLUMN_MIN_WIDTHS = {
 }
 TREE_MIN_VISIBLE_ROWS = 6
 TREE_MAX_VISIBLE_ROWS = 18
+# (chip text, background, foreground) per token state; None is the fallback.
+_TOKEN_CHIP_STYLES = {
+    "red": ("Token not detected", "#fde3e3", "#8f1f1f"),
+    "blue": ("Token on host", "#dfeafe", "#1f4d8a"),
+    "green": ("Token attached to WSL", "#dff5e6", "#1f6a3a"),
+    None: ("Token status unknown", "#f3f4f6", "#334155"),
+}
 AUTO_ATTACH_RETRY_SECONDS = 30
+LOG_MAX_LINES = 1000
+LOG_TRIM_LINES = 200  # oldest lines dropped once the cap is exceeded
 
 
 def is_security_key_device(dev):
-    vidpid = (dev.get("vidpid") or "").strip().lower()
-    device = (dev.get("device") or "").strip().lower()
-
-    for pref in ALLOW_VIDPID_PREFIXES:
-        if vidpid.startswith(pref.lower()):
-            return True
-    for kw in ALLOW_DEVICE_KEYWORDS:
-        if kw and kw.lower() in device:
-            return True
-    return False
+    vidpid = (dev.get("vidpid") or "").lower()
+    if vidpid.startswith(_ALLOW_VIDPID_PREFIXES_TUPLE):
+        return True
+    device = (dev.get("device") or "").lower()
+    return any(kw in device for kw in _ALLOW_KEYWORDS_LOWER)
 
 
 def is_wsl_attached_state(state_text):
@@ -80,6 +102,11 @@ def is_wsl_attached_state(state_text):
     return "attached" in state and "not attached" not in state
 
 
+def is_shared_state(state_text):
+    state = (state_text or "").strip().lower()
+    return state.startswith("shared") or is_wsl_attached_state(state)
+
+
 def get_security_key_state(devices):
     keys = [d for d in devices if is_security_key_device(d)]
     if not keys:
@@ -91,9 +118,29 @@ def get_security_key_state(devices):
     return "blue", "Security key: detected on host (not attached to WSL)"
 
 
+# Hidden-window spawn settings so the 3s tray poll doesn't flash a console
+# (conhost attach/teardown dominates subprocess cost on Windows).
+if sys.platform == "win32":
+    _RUN_CMD_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW
+    _RUN_CMD_STARTUPINFO = subprocess.STARTUPINFO()
+    _RUN_CMD_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _RUN_CMD_STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+else:
+    _RUN_CMD_CREATIONFLAGS = 0
+    _RUN_CMD_STARTUPINFO = None
+
+
 def run_cmd(cmd, timeout=25):
     try:
-        p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, shell=False)
+        p = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            shell=False,
+            creationflags=_RUN_CMD_CREATIONFLAGS,
+            startupinfo=_RUN_CMD_STARTUPINFO,
+        )
         return p.returncode, p.stdout.strip(), p.stderr.strip()
     except FileNotFoundError:
         return 127, "", f"Command not found: {cmd[0]}"
@@ -103,74 +150,253 @@ def run_cmd(cmd, timeout=25):
         return 1, "", str(e)
 
 
-def usbipd_list():
-    rc, out, err = run_cmd(["usbipd", "list"], timeout=20)
+# usbipd.exe invocations interact through the kernel driver and must not
+# race each other; every helper below serializes on this lock. Reentrant so
+# usbipd_attach can call usbipd_bind while holding it.
+_usbipd_lock = threading.RLock()
+
+# Fixed argv templates, tokenized once; only the busid varies per call and
+# nothing ever goes through a shell.
+# Each helper binds its template as a default argument (a local lookup,
+# resolved once at def time) rather than re-reading the module global per
+# call.
+_LIST_ARGV = ("usbipd", "list")
+_STATE_ARGV = ("usbipd", "state")
+_BIND_ARGV = ("usbipd", "bind", "--busid")
+_UNBIND_ARGV = ("usbipd", "unbind", "--busid")
+_ATTACH_ARGV = ("usbipd", "attach", "--wsl", "--busid")
+_DETACH_ARGV = ("usbipd", "detach", "--busid")
+
+
+def usbipd_list_output(_argv=_LIST_ARGV):
+    with _usbipd_lock:
+        rc, out, err = run_cmd(_argv, timeout=20)
     if rc != 0:
         raise RuntimeError(err or out or "usbipd list failed")
+    return out
+
+
+# Columns are separated by 2+ spaces; the greedy DEVICE group pushes the
+# split to the last gap, so names that contain double spaces stay intact.
+_LIST_ROW_RE = re.compile(r"^(\S+)\s{2,}(\S+)\s{2,}(.+)\s{2,}(\S.*?)\s*$")
 
+
+def parse_usbipd_list(out):
     lines = [ln.rstrip() for ln in out.splitlines() if ln.strip()]
     if len(lines) < 2:
         return []
 
     results = []
     for ln in lines[1:]:
-        # Split by 2+ spaces so "DEVICE" can contain spaces
-        parts = [p for p in ln.split("  ") if p.strip()]
-        parts = [p.strip() for p in parts]
-        if len(parts) < 4:
+        m = _LIST_ROW_RE.match(ln)
+        if not m:
             continue
 
-        busid = parts[0]
-        vidpid = parts[1]
-        state = parts[-1]
-        device = "  ".join(parts[2:-1]).strip() if len(parts) > 4 else parts[2]
-
         results.append({
+            "busid": m.group(1),
+            "vidpid": m.group(2),
+            "device": m.group(3).strip(),
+            "state": m.group(4)
+        })
+    return results
+
+
+def _vidpid_from_instance_id(instance_id):
+    m = re.search(r"VID_([0-9A-Fa-f]{4})&PID_([0-9A-Fa-f]{4})", instance_id or "")
+    return f"{m.group(1).lower()}:{m.group(2).lower()}" if m else ""
+
+
+def parse_usbipd_state(out):
+    data = json.loads(out)
+
+    devices = []
+    for d in data.get("Devices", []):
+        busid = d.get("BusId")
+        if not busid:
+            # Persisted-but-unplugged entries carry no bus id.
+            continue
+
+        hw = d.get("HardwareId") or {}
+        if "Vid" in hw and "Pid" in hw:
+            vidpid = f"{hw['Vid']:04x}:{hw['Pid']:04x}"
+        else:
+            vidpid = _vidpid_from_instance_id(d.get("InstanceId"))
+
+        if d.get("ClientIPAddress"):
+            state = "Attached"
+        elif d.get("IsForced") or d.get("PersistedGuid"):
+            state = "Shared"
+        else:
+            state = "Not shared"
+
+        devices.append({
             "busid": busid,
             "vidpid": vidpid,
-            "device": device,
+            "device": d.get("Description"),
             "state": state
         })
-    return results
+    return devices
+
+
+def usbipd_state_output(_argv=_STATE_ARGV):
+    # `usbipd state` (v4+) emits machine-readable JSON that is both faster to
+    # parse and immune to column-width drift in the `usbipd list` table.
+    with _usbipd_lock:
+        rc, out, err = run_cmd(_argv, timeout=20)
+        if rc == 0 and out.lstrip().startswith("{"):
+            return out
+        return usbipd_list_output()
+
+
+def parse_usbipd_devices(out):
+    if out.lstrip().startswith("{"):
+        try:
+            return parse_usbipd_state(out)
+        except (json.JSONDecodeError, KeyError, TypeError):
+            pass
+    return parse_usbipd_list(out)
+
+
+def usbipd_list():
+    return parse_usbipd_devices(usbipd_state_output())
 
 
-def usbipd_bind(busid):
-    rc, out, err = run_cmd(["usbipd", "bind", "--busid", busid], timeout=30)
+class DeviceCache:
+    """Shares one `usbipd list` result between the tray poller and the UI
+    refresh worker so concurrent consumers don't each spawn a subprocess."""
+
+    __slots__ = ("_lock", "_timestamp", "_devices", "_raw_out_hash")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timestamp = 0.0
+        self._devices = None
+        self._raw_out_hash = None
+
+    def get(self, max_age_s=DEVICE_CACHE_MAX_AGE_SECONDS):
+        """Return (devices, changed).
+
+        Reuses the cached list when younger than max_age_s; otherwise runs
+        `usbipd list` again. `changed` is False when the raw output hash
+        matches the previous read (device set unchanged), letting callers
+        skip their own diffing work.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._devices is not None and now - self._timestamp < max_age_s:
+                return self._devices, False
+
+            out = usbipd_state_output()
+            h = hash(out)
+            if self._devices is not None and h == self._raw_out_hash:
+                self._timestamp = now
+                return self._devices, False
+
+            self._devices = parse_usbipd_devices(out)
+            self._raw_out_hash = h
+            self._timestamp = now
+            return self._devices, True
+
+    def invalidate(self):
+        with self._lock:
+            self._timestamp = 0.0
+            self._raw_out_hash = None
+
+    def peek_state(self, busid):
+        """Last known state for a busid, or None; never spawns a subprocess."""
+        with self._lock:
+            for d in self._devices or ():
+                if d.get("busid") == busid:
+                    return d.get("state")
+        return None
+
+
+def usbipd_bind(busid, _argv=_BIND_ARGV):
+    with _usbipd_lock:
+        rc, out, err = run_cmd((*_argv, busid), timeout=30)
     if rc != 0 and "already bound" not in (out + err).lower():
         raise RuntimeError(err or out or f"Bind (enable sharing) failed for {busid}")
     return out or "Sharing enabled (bind OK)."
 
 
-def usbipd_unbind(busid):
-    rc, out, err = run_cmd(["usbipd", "unbind", "--busid", busid], timeout=30)
+def usbipd_unbind(busid, _argv=_UNBIND_ARGV):
+    with _usbipd_lock:
+        rc, out, err = run_cmd((*_argv, busid), timeout=30)
     if rc != 0:
         raise RuntimeError(err or out or f"Unbind (disable sharing) failed for {busid}")
     return out or "Sharing disabled (unbind OK)."
 
 
-def usbipd_attach(busid):
-    usbipd_bind(busid)
-    rc, out, err = run_cmd(["usbipd", "attach", "--wsl", "--busid", busid], timeout=30)
-    if rc != 0:
-        raise RuntimeError(err or out or f"Attach failed for {busid}")
-    return out or "Attach OK."
+def usbipd_attach(busid, known_state=None, _argv=_ATTACH_ARGV):
+    with _usbipd_lock:
+        if is_shared_state(known_state):
+            # Already bound per the cached list: go straight to attach and
+            # only pay for bind if usbipd disagrees (stale cache).
+            rc, out, err = run_cmd((*_argv, busid), timeout=30)
+            if rc == 0:
+                return out or "Attach OK."
+            if "not shared" not in (out + err).lower():
+                raise RuntimeError(err or out or f"Attach failed for {busid}")
+
+        usbipd_bind(busid)
+        rc, out, err = run_cmd((*_argv, busid), timeout=30)
+        if rc != 0:
+            raise RuntimeError(err or out or f"Attach failed for {busid}")
+        return out or "Attach OK."
 
 
-def usbipd_detach(busid):
-    rc, out, err = run_cmd(["usbipd", "detach", "--busid", busid], timeout=30)
+def usbipd_detach(busid, _argv=_DETACH_ARGV):
+    with _usbipd_lock:
+        rc, out, err = run_cmd((*_argv, busid), timeout=30)
     if rc != 0:
         raise RuntimeError(err or out or f"Detach failed for {busid}")
     return out or "Detach OK."
 
 
+@dataclass(slots=True)
+class AutoAttachState:
+    """Per-busid auto-attach bookkeeping: one dict probe covers both the
+    manual block and the failure-retry gate."""
+    blocked: bool = False
+    retry_gated: bool = False
+
+
+@functools.lru_cache(maxsize=None)
+def _tray_icon(fill_color):
+    # Cached at module level: the icons never change, so build each 64x64
+    # RGBA image once instead of on every tray start.
+    size = 64
+    img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse((8, 8, size - 8, size - 8), fill=fill_color, outline="#202020", width=4)
+    return img
+
+
 class SecurityKeyTray:
+    __slots__ = (
+        "app",
+        "icon",
+        "_icons",
+        "_last_state",
+        "_last_title",
+        "_identical_polls",
+        "_current_interval",
+        "_stop_evt",
+        "_wake_evt",
+        "_icon_thread",
+        "_poll_thread",
+    )
+
     def __init__(self, app):
         self.app = app
         self.icon = None
         self._icons = {}
         self._last_state = None
         self._last_title = None
+        self._identical_polls = 0
+        self._current_interval = TRAY_POLL_INTERVAL_SECONDS
         self._stop_evt = threading.Event()
+        self._wake_evt = threading.Event()
         self._icon_thread = None
         self._poll_thread = None
 
@@ -180,9 +406,9 @@ class SecurityKeyTray:
             return False
 
         self._icons = {
-            "red": self._build_icon("#cc2f2f"),
-            "blue": self._build_icon("#2b72d6"),
-            "green": self._build_icon("#2e9d48"),
+            "red": _tray_icon("#cc2f2f"),
+            "blue": _tray_icon("#2b72d6"),
+            "green": _tray_icon("#2e9d48"),
         }
 
         self.icon = pystray.Icon("wsl-usb-buddy")
@@ -203,28 +429,48 @@ class SecurityKeyTray:
 
     def stop(self):
         self._stop_evt.set()
+        self._wake_evt.set()
         if self.icon is not None:
             try:
                 self.icon.stop()
             except Exception:
                 pass
 
-    def _build_icon(self, fill_color):
-        size = 64
-        img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw.ellipse((8, 8, size - 8, size - 8), fill=fill_color, outline="#202020", width=4)
-        return img
+    def poke(self):
+        # A user action just happened; wake the poll loop now and keep it on
+        # the fast interval for a cycle, then let backoff resume.
+        self._identical_polls = 0
+        self._current_interval = TRAY_POLL_FAST_SECONDS
+        self._wake_evt.set()
 
     def _poll_loop(self):
-        while not self._stop_evt.is_set():
+        # Bound once outside the loop; this thread runs for the app lifetime
+        # and each tick otherwise repeats the same attribute chains.
+        stop_requested = self._stop_evt.is_set
+        cache_get = self.app.device_cache.get
+        apply_state = self._apply_state
+        wake_wait = self._wake_evt.wait
+        wake_clear = self._wake_evt.clear
+
+        while not stop_requested():
             try:
-                devices = usbipd_list()
+                devices, changed = cache_get()
+                if changed:
+                    self._identical_polls = 0
+                    self._current_interval = TRAY_POLL_INTERVAL_SECONDS
+                else:
+                    # Device set unchanged: back off the poll interval.
+                    self._identical_polls += 1
+                    if self._identical_polls >= TRAY_POLL_BACKOFF_AFTER:
+                        self._current_interval = min(self._current_interval * 2, TRAY_POLL_MAX_SECONDS)
                 state, title = get_security_key_state(devices)
             except Exception as e:
                 state, title = "red", f"Security key: status error ({e})"
-            self._apply_state(state, title)
-            self._stop_evt.wait(TRAY_POLL_INTERVAL_SECONDS)
+            apply_state(state, title)
+            # Sleeps for the adaptive interval, but a poke() ends the wait
+            # immediately so attach/detach results show without polling lag.
+            wake_wait(self._current_interval)
+            wake_clear()
 
     def _apply_state(self, state, title):
         if self.icon is None:
@@ -234,7 +480,7 @@ class SecurityKeyTray:
         self._last_state = state
         self._last_title = title
         try:
-            self.app.gui_queue.put((self.app._set_token_status_chip, (state, title)))
+            self.app.post(self.app._set_token_status_chip, state, title)
         except Exception:
             pass
         try:
@@ -244,22 +490,50 @@ class SecurityKeyTray:
             pass
 
     def _on_show_window(self, icon, item):
-        self.app.gui_queue.put((self.app.show_window, ()))
+        self.app.post(self.app.show_window)
 
     def _on_refresh_devices(self, icon, item):
-        self.app.gui_queue.put((self.app.refresh_devices, ()))
+        self.app.post(self.app.refresh_devices)
 
     def _on_exit(self, icon, item):
-        self.app.gui_queue.put((self.app.on_close_clicked, ()))
+        self.app.post(self.app.on_close_clicked)
 
 
 class App:
     def __init__(self):
-        self.gui_queue = queue.Queue()
+        # deque appends/pops are single atomic ops under the GIL, so this
+        # producer/consumer mailbox needs no mutex or condition variable.
+        self.gui_queue = collections.deque()
         self._closing = False
         self._last_tree_width = 0
-        self._auto_attach_retry_until = {}
-        self._auto_attach_blocked_busids = set()
+        self._resize_pending = None
+        self._current_col_widths = {}
+        # Auto-attach bookkeeping: one AutoAttachState per busid, plus a
+        # heap of (monotonic deadline, busid) indexing the retry gates so
+        # expiry is O(log n) pops on a jump-immune clock.
+        self._auto_attach_state = {}
+        self._auto_attach_retry_heap = []
+        self.device_cache = DeviceCache()
+        # One warm worker thread for all usbipd operations; usbipd.exe does
+        # not like concurrent bind/attach, so serializing here is a feature.
+        # (An asyncio subprocess loop was considered and rejected: with at
+        # most one operation in flight by design, a second event loop thread
+        # would add a Tk/asyncio bridge without removing any thread spawns.)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="usbipd")
+        self._tree_rows = {}    # busid -> tree iid
+        self._tree_values = {}  # tree iid -> last values tuple
+        self._log_pending = []
+        self._log_flush_scheduled = False
+        self._last_totals = (None, None, None)
+        self._last_chip = (None, None)
+        self._busy = None
+        self._refresh_pending = False
+        self._last_refresh_ts = 0.0
+        # Busids with an operation currently running; duplicate requests for
+        # the same busid are dropped instead of queued behind each other.
+        self._inflight = set()
+        self._inflight_lock = threading.Lock()
+        self._selected_busid_cache = None
 
         self.root = tk.Tk()
         self.root.title("WSL USB Buddy (Public-Safe / Stateless)")
@@ -270,7 +544,9 @@ class App:
 
         self._build_styles()
         self._build_ui()
-        self.root.after(100, self._process_gui_queue)
+        self.root.bind("<<GuiWork>>", self._on_gui_work)
+        self._wake_pipe_w = None
+        self._setup_wake_pipe()
 
         self.tray = SecurityKeyTray(self)
         if self.tray.start():
@@ -440,6 +716,7 @@ class App:
         self.tree.configure(yscroll=vsb.set)
         self.tree.pack(side="left", fill="both", expand=True)
         self.tree.bind("<Configure>", self._on_tree_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
         vsb.pack(side="right", fill="y")
         self.root.after(0, lambda: self._apply_tree_column_scaling(self.tree.winfo_width()))
 
@@ -449,16 +726,16 @@ class App:
         self.btn_refresh = ttk.Button(btns, text="Refresh", style="Action.TButton", command=self.refresh_devices)
         self.btn_refresh.pack(side="left")
 
-        self.btn_share_on = ttk.Button(btns, text="Enable Sharing", style="Action.TButton", command=self.bind_selected)
+        self.btn_share_on = ttk.Button(btns, text="Enable Sharing", style="Action.TButton", command=self.bind_selected, state="disabled")
         self.btn_share_on.pack(side="left", padx=8)
 
-        self.btn_share_off = ttk.Button(btns, text="Disable Sharing", style="Action.TButton", command=self.unbind_selected)
+        self.btn_share_off = ttk.Button(btns, text="Disable Sharing", style="Action.TButton", command=self.unbind_selected, state="disabled")
         self.btn_share_off.pack(side="left")
 
-        self.btn_attach = ttk.Button(btns, text="Attach to WSL", style="Primary.TButton", command=self.attach_selected)
+        self.btn_attach = ttk.Button(btns, text="Attach to WSL", style="Primary.TButton", command=self.attach_selected, state="disabled")
         self.btn_attach.pack(side="left", padx=8)
 
-        self.btn_detach = ttk.Button(btns, text="Detach from WSL", style="Action.TButton", command=self.detach_selected)
+        self.btn_detach = ttk.Button(btns, text="Detach from WSL", style="Action.TButton", command=self.detach_selected, state="disabled")
         self.btn_detach.pack(side="left")
 
         log_frame = ttk.LabelFrame(shell, text="Session Log", style="Card.TLabelframe", padding=10)
@@ -495,19 +772,20 @@ class App:
         return card
 
     def _set_token_status_chip(self, state, title):
-        color_map = {
-            "red": ("Token not detected", "#fde3e3", "#8f1f1f"),
-            "blue": ("Token on host", "#dfeafe", "#1f4d8a"),
-            "green": ("Token attached to WSL", "#dff5e6", "#1f6a3a"),
-        }
-        chip_text, bg_color, fg_color = color_map.get(state, ("Token status unknown", "#f3f4f6", "#334155"))
+        if (state, title) == self._last_chip:
+            return
+        self._last_chip = (state, title)
+        chip_text, bg_color, fg_color = _TOKEN_CHIP_STYLES.get(state, _TOKEN_CHIP_STYLES[None])
         self.token_status_chip.configure(text=chip_text, bg=bg_color, fg=fg_color)
         self.token_status_chip_tooltip = title
 
     def _on_auto_attach_toggle(self):
         state = "enabled" if self.auto_attach_var.get() else "disabled"
         if self.auto_attach_var.get():
-            self._auto_attach_blocked_busids.clear()
+            for busid, st in list(self._auto_attach_state.items()):
+                st.blocked = False
+                if not st.retry_gated:
+                    del self._auto_attach_state[busid]
         self.log_line(f"Auto-attach known devices {state}.")
         self.refresh_devices()
 
@@ -520,32 +798,136 @@ class App:
 
     def log_line(self, msg):
         ts = time.strftime("%H:%M:%S")
-        self.log.insert("end", f"[{ts}] {msg}\n")
+        self._log_pending.append(f"[{ts}] {msg}\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        # One insert + one scroll per idle cycle regardless of how many lines
+        # arrived; then trim so hours of tray uptime can't grow the widget
+        # without bound.
+        self._log_flush_scheduled = False
+        if not self._log_pending:
+            return
+        text = "".join(self._log_pending)
+        self._log_pending.clear()
+        self.log.insert("end", text)
+        if int(self.log.index("end-1c").split(".")[0]) > LOG_MAX_LINES:
+            self.log.delete("1.0", f"{LOG_TRIM_LINES + 1}.0")
         self.log.see("end")
 
-    def _process_gui_queue(self):
+    def _setup_wake_pipe(self):
+        # On Unix Tk builds a self-pipe watched by createfilehandler is the
+        # fully thread-safe way to wake the event loop; a one-byte write from
+        # any thread dispatches queued work with no polling. Windows Tk has
+        # no createfilehandler, so post() falls back to event_generate there.
+        if sys.platform == "win32":
+            return
         try:
-            while True:
-                fn, args = self.gui_queue.get_nowait()
-                fn(*args)
-        except queue.Empty:
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_wake_pipe)
+            self._wake_pipe_w = write_fd
+        except Exception:
+            self._wake_pipe_w = None
+
+    def _on_wake_pipe(self, fd, mask):
+        try:
+            os.read(fd, 4096)
+        except OSError:
             pass
-        self.root.after(100, self._process_gui_queue)
+        self._drain_gui_queue()
+
+    def _submit(self, fn, *args):
+        # Workers only catch the RuntimeErrors the usbipd helpers raise;
+        # anything else would vanish inside the Future, so surface it here.
+        fut = self._executor.submit(fn, *args)
+        fut.add_done_callback(self._report_worker_crash)
+        return fut
+
+    def _report_worker_crash(self, fut):
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if exc is not None:
+            self.post(self._error_ui, "Unexpected worker error", f"{type(exc).__name__}: {exc}")
+
+    def post(self, fn, *args):
+        """Queue a callable for the Tk thread and wake the event loop.
+
+        Wakes via the self-pipe (Unix) or a virtual event (Windows) instead
+        of a periodic pump, so the loop stays asleep while idle and work is
+        dispatched as soon as posted.
+        """
+        self.gui_queue.append((fn, args))
+        if self._wake_pipe_w is not None:
+            try:
+                os.write(self._wake_pipe_w, b"\x00")
+                return
+            except OSError:
+                pass
+        try:
+            self.root.event_generate("<<GuiWork>>", when="tail")
+        except Exception:
+            # event_generate can fail during teardown or on platforms that
+            # reject cross-thread event injection; fall back to after().
+            try:
+                self.root.after(0, self._drain_gui_queue)
+            except Exception:
+                pass
+
+    def _on_gui_work(self, event):
+        self._drain_gui_queue()
+
+    def _drain_gui_queue(self):
+        while True:
+            try:
+                fn, args = self.gui_queue.popleft()
+            except IndexError:
+                break
+            fn(*args)
 
     def _ui_set_busy(self, busy=True):
-        state = "disabled" if busy else "normal"
-        for b in (self.btn_refresh, self.btn_share_on, self.btn_share_off, self.btn_attach, self.btn_detach):
+        busy = bool(busy)
+        if busy == self._busy:
+            return
+        self._busy = busy
+        self.btn_refresh.configure(state="disabled" if busy else "normal")
+        self._update_action_buttons()
+
+    def _update_action_buttons(self):
+        # Per-device buttons are live only when a row is selected and no
+        # operation is running; handlers can then assume a busid exists.
+        state = "normal" if self._selected_busid_cache and not self._busy else "disabled"
+        for b in (self.btn_share_on, self.btn_share_off, self.btn_attach, self.btn_detach):
             b.configure(state=state)
 
-    def _selected_busid(self):
+    def _on_tree_select(self, event=None):
+        self._selected_busid_cache = self._read_selected_busid()
+        self._update_action_buttons()
+
+    def _read_selected_busid(self):
         sel = self.tree.selection()
         if not sel:
             return None
         vals = self.tree.item(sel[0]).get("values", [])
         return str(vals[0]).strip() if vals else None
 
+    def _selected_busid(self):
+        # Updated by <<TreeviewSelect>>, so click handlers read a cached
+        # value instead of issuing selection()/item() Tcl queries per click.
+        return self._selected_busid_cache
+
     def _on_tree_resize(self, event):
-        width = int(getattr(event, "width", 0) or 0)
+        # <Configure> arrives in bursts during a window drag; coalesce them
+        # into one recompute per idle cycle instead of one per event.
+        if self._resize_pending is None:
+            self._resize_pending = self.root.after_idle(self._do_tree_resize)
+
+    def _do_tree_resize(self):
+        self._resize_pending = None
+        width = int(self.tree.winfo_width() or 0)
         if width <= 0:
             return
         if abs(width - self._last_tree_width) < 4:
@@ -581,8 +963,15 @@ class App:
         if extra > 0:
             new_widths["device"] += extra
 
+        if new_widths == self._current_col_widths:
+            return
+
+        # Only touch columns whose width actually changed; each column call
+        # crosses into Tcl and triggers a redraw.
         for col in ("busid", "vidpid", "device", "state"):
-            self.tree.column(col, width=new_widths[col], minwidth=TREE_COLUMN_MIN_WIDTHS[col], stretch=True)
+            if self._current_col_widths.get(col) != new_widths[col]:
+                self.tree.column(col, width=new_widths[col], minwidth=TREE_COLUMN_MIN_WIDTHS[col], stretch=True)
+        self._current_col_widths = new_widths
 
     def _fit_tree_rows(self, visible_count):
         rows = max(TREE_MIN_VISIBLE_ROWS, min(TREE_MAX_VISIBLE_ROWS, int(visible_count or 0)))
@@ -590,8 +979,19 @@ class App:
 
     def _auto_attach_known_devices(self, devices):
         logs = []
-        changed = False
-        now = time.time()
+        attached = []
+        now = time.monotonic()
+        state_get = self._auto_attach_state.get
+        logs_append = logs.append
+
+        heap = self._auto_attach_retry_heap
+        while heap and heap[0][0] <= now:
+            _, expired_busid = heapq.heappop(heap)
+            st = self._auto_attach_state.get(expired_busid)
+            if st is not None:
+                st.retry_gated = False
+                if not st.blocked:
+                    del self._auto_attach_state[expired_busid]
 
         for d in devices:
             if not is_security_key_device(d):
@@ -602,23 +1002,20 @@ class App:
             busid = (d.get("busid") or "").strip()
             if not busid:
                 continue
-            if busid in self._auto_attach_blocked_busids:
-                continue
-
-            retry_until = self._auto_attach_retry_until.get(busid, 0)
-            if retry_until > now:
+            st = state_get(busid)
+            if st is not None and (st.blocked or st.retry_gated):
                 continue
 
             try:
-                usbipd_attach(busid)
-                changed = True
-                self._auto_attach_retry_until.pop(busid, None)
-                logs.append(f"Auto-attach OK: {busid}.")
-            except Exception as e:
-                self._auto_attach_retry_until[busid] = now + AUTO_ATTACH_RETRY_SECONDS
-                logs.append(f"Auto-attach failed for {busid}: {e}")
+                usbipd_attach(busid, known_state=d.get("state"))
+                attached.append(busid)
+                logs_append(f"Auto-attach OK: {busid}.")
+            except RuntimeError as e:
+                heapq.heappush(heap, (now + AUTO_ATTACH_RETRY_SECONDS, busid))
+                self._auto_attach_state.setdefault(busid, AutoAttachState()).retry_gated = True
+                logs_append(f"Auto-attach failed for {busid}: {e}")
 
-        return changed, logs
+        return attached, logs
 
     def show_window(self):
         if self._closing:
@@ -662,47 +1059,87 @@ class App:
 
     # ---- refresh ----
     def refresh_devices(self):
+        # Coalesce bursts (operation completions, quick clicks, tray menu)
+        # into at most one refresh per debounce window.
+        if self._closing or self._refresh_pending:
+            return
+        if time.monotonic() - self._last_refresh_ts < REFRESH_DEBOUNCE_SECONDS:
+            self._refresh_pending = True
+            self.root.after(int(REFRESH_DEBOUNCE_SECONDS * 1000), self._do_refresh)
+            return
+        self._do_refresh()
+
+    def _do_refresh(self):
+        self._refresh_pending = False
         if self._closing:
             return
+        self._last_refresh_ts = time.monotonic()
         self._ui_set_busy(True)
         self.log_line("Refreshing device list...")
+        if getattr(self, "tray", None):
+            self.tray.poke()
         auto_attach_enabled = bool(self.auto_attach_var.get())
         show_all_enabled = bool(self.show_all_var.get())
-        threading.Thread(
-            target=self._refresh_worker,
-            args=(auto_attach_enabled, show_all_enabled),
-            daemon=True,
-        ).start()
+        self._submit(self._refresh_worker, auto_attach_enabled, show_all_enabled)
 
     def _refresh_worker(self, auto_attach_enabled, show_all_enabled):
         try:
-            devs = usbipd_list()
+            devs, _ = self.device_cache.get()
             auto_logs = []
 
             if auto_attach_enabled:
-                changed, auto_logs = self._auto_attach_known_devices(devs)
-                if changed:
-                    devs = usbipd_list()
+                attached, auto_logs = self._auto_attach_known_devices(devs)
+                if attached:
+                    # Patch the states we just changed instead of shelling out
+                    # again; the next cache read re-observes the real state.
+                    self.device_cache.invalidate()
+                    for d in devs:
+                        if d.get("busid") in attached:
+                            d["state"] = "Attached"
 
             shown = [d for d in devs if self._is_allowed_device(d, show_all=show_all_enabled)]
             token_state, token_title = get_security_key_state(devs)
-            self.gui_queue.put((
+            self.post(
                 self._refresh_ui,
-                (shown, len(devs), len(shown), token_state, token_title, auto_logs, show_all_enabled),
-            ))
-        except Exception as e:
-            self.gui_queue.put((self._error_ui, ("Refresh failed", str(e))))
+                shown, len(devs), len(shown), token_state, token_title, auto_logs, show_all_enabled,
+            )
+        except RuntimeError as e:
+            self.post(self._error_ui, "Refresh failed", str(e))
 
     def _refresh_ui(self, devs, total, shown, token_state, token_title, auto_logs, show_all_enabled):
-        for x in self.tree.get_children():
-            self.tree.delete(x)
+        # Diff against the current rows instead of delete-all/insert-all:
+        # busid is a stable key, so unchanged rows cost zero Tcl calls and
+        # the selection survives auto-refreshes.
+        new_by_busid = {d["busid"]: d for d in devs}
+
+        for busid in set(self._tree_rows) - set(new_by_busid):
+            iid = self._tree_rows.pop(busid)
+            self._tree_values.pop(iid, None)
+            self.tree.delete(iid)
+
         for d in devs:
-            self.tree.insert("", "end", values=(d["busid"], d["vidpid"], d["device"], d["state"]))
+            values = (d["busid"], d["vidpid"], d["device"], d["state"])
+            iid = self._tree_rows.get(d["busid"])
+            if iid is None:
+                iid = self.tree.insert("", "end", values=values)
+                self._tree_rows[d["busid"]] = iid
+                self._tree_values[iid] = values
+            elif self._tree_values.get(iid) != values:
+                self.tree.item(iid, values=values)
+                self._tree_values[iid] = values
 
         self._fit_tree_rows(shown)
-        self.total_devices_var.set(str(total))
-        self.visible_devices_var.set(str(shown))
-        self.hidden_devices_var.set(str(max(0, total - shown)))
+        # Each StringVar.set is a Tcl call; skip the ones whose value is
+        # already displayed (the usual case when the device set is stable).
+        hidden = max(0, total - shown)
+        last_total, last_shown, last_hidden = self._last_totals
+        if total != last_total:
+            self.total_devices_var.set(str(total))
+        if shown != last_shown:
+            self.visible_devices_var.set(str(shown))
+        if hidden != last_hidden:
+            self.hidden_devices_var.set(str(hidden))
+        self._last_totals = (total, shown, hidden)
         self._set_token_status_chip(token_state, token_title)
         for line in auto_logs:
             self.log_line(line)
@@ -723,87 +1160,128 @@ class App:
     def bind_selected(self):
         busid = self._selected_busid()
         if not busid:
-            messagebox.showinfo("Pick a device", "Select a USB device first.")
+            return
+        if busid in self._inflight:
+            self.log_line(f"Ignored: operation already running for {busid}.")
             return
         self._ui_set_busy(True)
         self.log_line(f"Enabling sharing for {busid} (bind)...")
-        threading.Thread(target=self._bind_worker, args=(busid,), daemon=True).start()
+        self._submit(self._bind_worker, busid)
 
     def _bind_worker(self, busid):
+        with self._inflight_lock:
+            if busid in self._inflight:
+                return
+            self._inflight.add(busid)
         try:
             msg = usbipd_bind(busid)
-            self.gui_queue.put((self._op_ok_ui, (f"Sharing enabled for {busid}", msg)))
-        except Exception as e:
-            self.gui_queue.put((self._error_ui, ("Enable sharing failed", str(e))))
+            self.post(self._op_ok_ui, f"Sharing enabled for {busid}", msg)
+        except RuntimeError as e:
+            self.post(self._error_ui, "Enable sharing failed", str(e))
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(busid)
 
     def unbind_selected(self):
         busid = self._selected_busid()
         if not busid:
-            messagebox.showinfo("Pick a device", "Select a USB device first.")
+            return
+        if busid in self._inflight:
+            self.log_line(f"Ignored: operation already running for {busid}.")
             return
         self._ui_set_busy(True)
         self.log_line(f"Disabling sharing for {busid} (unbind)...")
-        threading.Thread(target=self._unbind_worker, args=(busid,), daemon=True).start()
+        self._submit(self._unbind_worker, busid)
 
     def _unbind_worker(self, busid):
+        with self._inflight_lock:
+            if busid in self._inflight:
+                return
+            self._inflight.add(busid)
         try:
             msg = usbipd_unbind(busid)
-            self._auto_attach_blocked_busids.add(busid)
-            self.gui_queue.put((self._op_ok_ui, (f"Sharing disabled for {busid}", msg)))
-        except Exception as e:
-            self.gui_queue.put((self._error_ui, ("Disable sharing failed", str(e))))
+            self._auto_attach_state.setdefault(busid, AutoAttachState()).blocked = True
+            self.post(self._op_ok_ui, f"Sharing disabled for {busid}", msg)
+        except RuntimeError as e:
+            self.post(self._error_ui, "Disable sharing failed", str(e))
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(busid)
 
     def attach_selected(self):
         busid = self._selected_busid()
         if not busid:
-            messagebox.showinfo("Pick a device", "Select a USB device first.")
+            return
+        if busid in self._inflight:
+            self.log_line(f"Ignored: operation already running for {busid}.")
             return
         self._ui_set_busy(True)
         self.log_line(f"Attaching {busid} to WSL (bind + attach)...")
-        threading.Thread(target=self._attach_worker, args=(busid,), daemon=True).start()
+        self._submit(self._attach_worker, busid)
 
     def _attach_worker(self, busid):
+        with self._inflight_lock:
+            if busid in self._inflight:
+                return
+            self._inflight.add(busid)
         try:
-            msg = usbipd_attach(busid)
-            self._auto_attach_blocked_busids.discard(busid)
-            self._auto_attach_retry_until.pop(busid, None)
-            self.gui_queue.put((self._op_ok_ui, (f"Attach OK: {busid}", msg)))
-        except Exception as e:
-            self.gui_queue.put((self._error_ui, ("Attach failed", str(e))))
+            msg = usbipd_attach(busid, known_state=self.device_cache.peek_state(busid))
+            # Stale heap entries for this busid are skipped harmlessly later.
+            self._auto_attach_state.pop(busid, None)
+            self.post(self._op_ok_ui, f"Attach OK: {busid}", msg)
+        except RuntimeError as e:
+            self.post(self._error_ui, "Attach failed", str(e))
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(busid)
 
     def detach_selected(self):
         busid = self._selected_busid()
         if not busid:
-            messagebox.showinfo("Pick a device", "Select a USB device first.")
+            return
+        if busid in self._inflight:
+            self.log_line(f"Ignored: operation already running for {busid}.")
             return
         self._ui_set_busy(True)
         self.log_line(f"Detaching {busid} from WSL...")
-        threading.Thread(target=self._detach_worker, args=(busid,), daemon=True).start()
+        self._submit(self._detach_worker, busid)
 
     def _detach_worker(self, busid):
+        with self._inflight_lock:
+            if busid in self._inflight:
+                return
+            self._inflight.add(busid)
         try:
             msg = usbipd_detach(busid)
-            self._auto_attach_blocked_busids.add(busid)
-            self.gui_queue.put((self._op_ok_ui, (f"Detach OK: {busid}", msg)))
-        except Exception as e:
-            self.gui_queue.put((self._error_ui, ("Detach failed", str(e))))
+            self._auto_attach_state.setdefault(busid, AutoAttachState()).blocked = True
+            self.post(self._op_ok_ui, f"Detach OK: {busid}", msg)
+        except RuntimeError as e:
+            self.post(self._error_ui, "Detach failed", str(e))
+        finally:
+            with self._inflight_lock:
+                self._inflight.discard(busid)
 
     def _op_ok_ui(self, title, details):
         self._ui_set_busy(False)
-        self.log_line(title)
-        if details:
-            self.log_line(details)
+        self.log_line(f"{title}\n{details}" if details else title)
         self.refresh_devices()
 
     def on_close_clicked(self):
         if self._closing:
             return
         self._closing = True
+        # tray.stop() and the executor shutdown can block on their worker
+        # threads; run teardown off the Tk thread so the window closes
+        # immediately instead of freezing on exit.
+        threading.Thread(target=self._shutdown, daemon=True).start()
+
+    def _shutdown(self):
         try:
             if getattr(self, "tray", None):
                 self.tray.stop()
+            self._executor.shutdown(wait=False, cancel_futures=True)
         finally:
-            self.root.destroy()
+            self.root.after(0, self.root.destroy)
 
     def run(self):
         self.root.mainloop()
@@ -12,6 +12,9 @@
 # Requires: usbipd-win v4+ on Windows, Python 3, Tkinter (included with standard Python)
 # Recommended: Run as Administrator for bind/attach/detach/unbind.
 
+import functools
+import os
+import shutil
 import threading
 import subprocess
 import queue
@@ -21,15 +24,18 @@ from tkinter import ttk, messagebox
 
 
 # ---- usbipd.exe resolver (no PATH required) ----
+@functools.cache
 def resolve_usbipd_exe():
     """
     Returns an absolute path to usbipd.exe if we can find it, otherwise returns 'usbipd'
     (so PATH still works as a fallback).
     Resolution order:
       1) USBIPD_EXE environment variable (full path)
-      2) usbipd.exe in the same folder as this script
-      3) Common install paths for usbipd-win
-      4) Fallback: 'usbipd' (requires PATH)
+      2) usbipd on PATH (one SearchPath lookup instead of stat'ing every
+         known install dir)
+      3) usbipd.exe in the same folder as this script
+      4) Common install paths for usbipd-win
+      5) Fallback: 'usbipd' (requires PATH)
     """
     env = os.environ.get("USBIPD_EXE", "").strip().strip('"')
     if env:
@@ -40,6 +46,10 @@ def resolve_usbipd_exe():
         if os.path.isfile(cand):
             return cand
 
+    found = shutil.which("usbipd.exe") or shutil.which("usbipd")
+    if found:
+        return found
+
     try:
         here = os.path.dirname(os.path.abspath(__file__))
         cand = os.path.join(here, "usbipd.exe")